@@ -18,12 +18,97 @@ Key Features:
 States are represented as a tuple:
     (missionaries_left, cannibals_left, boat_position)
     where boat_position is 1 if on the left bank and 0 if on the right bank.
+Internally, the searches pack each state into a 5-bit int, (m << 3) | (c << 1) | boat,
+and only unpack it for graph node labels.
 """
   
 from collections import deque
 import heapq
-import networkx as nx
-import matplotlib.pyplot as plt
+from itertools import count
+
+# NetworkX and Matplotlib are imported lazily, only when a graph is built or drawn.
+
+
+# Possible moves: (missionaries, cannibals)
+_POSSIBLE_MOVES = ((1, 0), (2, 0), (0, 1), (0, 2), (1, 1))
+
+
+def _is_valid_state(state):
+    """
+    Check the bounds and bank constraints for a state (m, c, boat).
+
+    Used once at import time to build _VALID_STATES.
+    """
+    m, c, _ = state
+    # Check numbers are within bounds
+    if not (0 <= m <= 3 and 0 <= c <= 3):
+        return False
+
+    # Left bank: if there are missionaries, they must not be outnumbered by cannibals.
+    if m > 0 and m < c:
+        return False
+
+    # Right bank: compute missionaries and cannibals on right bank
+    m_right = 3 - m
+    c_right = 3 - c
+    if m_right > 0 and m_right < c_right:
+        return False
+
+    return True
+
+
+def _compute_successors(state):
+    """
+    Generate the valid (new_state, action) pairs reachable from 'state'.
+
+    Used once at import time to build _SUCCESSOR_TABLE.
+    """
+    missionaries, cannibals, boat = state
+    successors = []
+
+    # Boat direction: if boat == 1, it moves from left to right; if 0, right to left.
+    sign = -1 if boat == 1 else 1
+    for m_move, c_move in _POSSIBLE_MOVES:
+        new_state = (missionaries + sign * m_move, cannibals + sign * c_move, 1 - boat)
+        if new_state in _VALID_STATES:
+            successors.append((new_state, (m_move, c_move)))
+    return tuple(successors)
+
+
+# All 4 * 4 * 2 states, filtered down to the valid ones, and their successors.
+_VALID_STATES = frozenset(
+    (m, c, boat)
+    for m in range(4) for c in range(4) for boat in (0, 1)
+    if _is_valid_state((m, c, boat))
+)
+_SUCCESSOR_TABLE = {state: _compute_successors(state) for state in _VALID_STATES}
+
+
+def _encode(m, c, boat):
+    """Pack a state (m, c, boat) into a single int."""
+    return (m << 3) | (c << 1) | boat
+
+
+def _decode(code):
+    """Unpack an int produced by _encode back into (m, c, boat)."""
+    return (code >> 3, (code >> 1) & 3, code & 1)
+
+
+# Int-state counterparts of the tables above, indexed by the packed state:
+# _DECODED[code] is the tuple form, _SUCCESSOR_CODES[code] the (successor_code, action)
+# pairs (empty for invalid states).
+_DECODED = tuple(_decode(code) for code in range(32))
+_SUCCESSOR_CODES = tuple(
+    tuple((_encode(*new_state), action) for new_state, action in _SUCCESSOR_TABLE[state])
+    if state in _VALID_STATES else ()
+    for state in _DECODED
+)
+
+
+def _new_state_graph():
+    """Return an empty NetworkX DiGraph for recording state transitions."""
+    import networkx as nx
+    return nx.DiGraph()
 
 
 class MissionariesAndCannibals:
@@ -48,147 +133,168 @@ class MissionariesAndCannibals:
             - The numbers of missionaries and cannibals are within the range [0, 3].
             - On each bank, if missionaries are present then they are not outnumbered by cannibals.
 
+        The check is a membership test against the states precomputed at import time.
+
         Args:
             state (tuple): A tuple (m, c, boat) representing the state.
 
         Returns:
             bool: True if the state is valid; False otherwise.
         """
-        m, c, _ = state
-        # Check numbers are within bounds
-        if not (0 <= m <= 3 and 0 <= c <= 3):
-            return False
-
-        # Left bank: if there are missionaries, they must not be outnumbered by cannibals.
-        if m > 0 and m < c:
-            return False
-
-        # Right bank: compute missionaries and cannibals on right bank
-        m_right = 3 - m
-        c_right = 3 - c
-        if m_right > 0 and m_right < c_right:
-            return False
-
-        return True
+        return state in _VALID_STATES
 
     def get_successors(self, state):
         """
-        Generate all valid successor states from the current state.
+        Return all valid successor states from the current state.
 
         Each move is represented by a tuple (m, c) indicating the number of missionaries and cannibals
         that move across the river. The boat's direction is determined by its current position.
-        
+        Successors are looked up in a table built once at import time.
+
         Args:
             state (tuple): The current state (missionaries_left, cannibals_left, boat).
 
         Returns:
-            list: A list of tuples where each tuple is (new_state, action) and
-                  action is a tuple (m, c) representing the move.
+            tuple: A tuple of pairs (new_state, action) where
+                   action is a tuple (m, c) representing the move.
         """
-        missionaries, cannibals, boat = state
-        # Possible moves: (missionaries, cannibals)
-        possible_moves = [(1, 0), (2, 0), (0, 1), (0, 2), (1, 1)]
-        successors = []
-
-        # Boat direction: if boat == 1, it moves from left to right; if 0, right to left.
-        for m_move, c_move in possible_moves:
-            if boat == 1:
-                new_state = (missionaries - m_move, cannibals - c_move, 0)
-            else:
-                new_state = (missionaries + m_move, cannibals + c_move, 1)
-            if self.is_valid(new_state):
-                successors.append((new_state, (m_move, c_move)))
-        return successors
-
-    def breadth_first_search(self):
+        return _SUCCESSOR_TABLE[state]
+
+    def breadth_first_search(self, build_graph=False):
         """
         Perform Breadth-First Search (BFS) to solve the problem.
 
+        Args:
+            build_graph (bool): If True, record the explored state transitions in a graph.
+
         Returns:
             tuple: A tuple (solution_path, graph) where:
                    - solution_path is a list of actions (moves) leading from the initial state to the goal state.
-                   - graph is a NetworkX directed graph representing the state transitions.
+                   - graph is a NetworkX directed graph representing the state transitions,
+                     or None when build_graph is False.
         """
-        # Each element in the queue is a tuple: (current_state, path_taken)
-        queue = deque([(self.initial_state, [])])
-        visited = set()
-        graph = nx.DiGraph()
+        # came_from doubles as the visited set: states enter it when generated,
+        # so each enters the queue once.
+        start, goal = _encode(*self.initial_state), _encode(*self.goal_state)
+        queue = deque([start])
+        came_from = {start: (None, None)}
+        graph = _new_state_graph() if build_graph else None
 
         while queue:
-            state, path = queue.popleft()
-            if state == self.goal_state:
-                return path, graph
-
-            if state not in visited:
-                visited.add(state)
-                for successor, action in self.get_successors(state):
-                    queue.append((successor, path + [action]))
-                    graph.add_edge(state, successor, action=str(action))
+            state = queue.popleft()
+            if state == goal:
+                return self._reconstruct_path(came_from, state), graph
+
+            for successor, action in _SUCCESSOR_CODES[state]:
+                if successor not in came_from:
+                    came_from[successor] = (state, action)
+                    queue.append(successor)
+                if graph is not None:
+                    graph.add_edge(_DECODED[state], _DECODED[successor], action=str(action))
         return None, graph
 
-    def depth_first_search(self):
+    def depth_first_search(self, build_graph=False):
         """
         Perform Depth-First Search (DFS) to solve the problem.
 
+        Args:
+            build_graph (bool): If True, record the explored state transitions in a graph.
+
         Returns:
             tuple: A tuple (solution_path, graph) where:
                    - solution_path is a list of actions (moves) leading from the initial state to the goal state.
-                   - graph is a NetworkX directed graph representing the state transitions.
+                   - graph is a NetworkX directed graph representing the state transitions,
+                     or None when build_graph is False.
         """
-        # Each element in the stack is a tuple: (current_state, path_taken)
-        stack = [(self.initial_state, [])]
-        visited = set()
-        graph = nx.DiGraph()
+        # came_from doubles as the visited set: states enter it when generated,
+        # so each enters the stack once.
+        start, goal = _encode(*self.initial_state), _encode(*self.goal_state)
+        stack = [start]
+        came_from = {start: (None, None)}
+        graph = _new_state_graph() if build_graph else None
 
         while stack:
-            state, path = stack.pop()
-            if state == self.goal_state:
-                return path, graph
-
-            if state not in visited:
-                visited.add(state)
-                for successor, action in self.get_successors(state):
-                    stack.append((successor, path + [action]))
-                    graph.add_edge(state, successor, action=str(action))
+            state = stack.pop()
+            if state == goal:
+                return self._reconstruct_path(came_from, state), graph
+
+            for successor, action in _SUCCESSOR_CODES[state]:
+                if successor not in came_from:
+                    came_from[successor] = (state, action)
+                    stack.append(successor)
+                if graph is not None:
+                    graph.add_edge(_DECODED[state], _DECODED[successor], action=str(action))
         return None, graph
 
-    def a_star_search(self):
+    def a_star_search(self, build_graph=False):
         """
         Perform A* Search to solve the problem using a simple heuristic.
 
         The heuristic function estimates the cost to reach the goal as the sum of
         missionaries and cannibals still on the left bank.
 
+        Args:
+            build_graph (bool): If True, record the explored state transitions in a graph.
+
         Returns:
             tuple: A tuple (solution_path, graph) where:
                    - solution_path is a list of actions (moves) leading from the initial state to the goal state.
-                   - graph is a NetworkX directed graph representing the state transitions.
+                   - graph is a NetworkX directed graph representing the state transitions,
+                     or None when build_graph is False.
         """
         def heuristic(state):
             # Simple heuristic: remaining number of people on the left bank
-            m, c, _ = state
-            return m + c
-
-        # Priority queue elements: (priority, state, path_taken)
-        priority_queue = [(heuristic(self.initial_state), self.initial_state, [])]
+            return (state >> 3) + ((state >> 1) & 3)
+
+        # Priority queue elements: (priority, tiebreak, state); paths are rebuilt from came_from.
+        # The insertion counter settles ties so states are never compared.
+        start, goal = _encode(*self.initial_state), _encode(*self.goal_state)
+        tiebreak = count()
+        priority_queue = [(heuristic(start), next(tiebreak), start)]
+        g_score = {start: 0}
+        came_from = {start: (None, None)}
         visited = set()
-        graph = nx.DiGraph()
+        graph = _new_state_graph() if build_graph else None
 
         while priority_queue:
-            _, state, path = heapq.heappop(priority_queue)
-            if state == self.goal_state:
-                return path, graph
+            _, _, state = heapq.heappop(priority_queue)
+            if state == goal:
+                return self._reconstruct_path(came_from, state), graph
 
             if state not in visited:
                 visited.add(state)
-                for successor, action in self.get_successors(state):
-                    new_path = path + [action]
-                    cost = len(new_path)  # Cost is path length (each move costs 1)
-                    priority = cost + heuristic(successor)
-                    heapq.heappush(priority_queue, (priority, successor, new_path))
-                    graph.add_edge(state, successor, action=str(action))
+                for successor, action in _SUCCESSOR_CODES[state]:
+                    cost = g_score[state] + 1  # Each move costs 1
+                    if cost < g_score.get(successor, float('inf')):
+                        g_score[successor] = cost
+                        came_from[successor] = (state, action)
+                        priority = cost + heuristic(successor)
+                        heapq.heappush(priority_queue, (priority, next(tiebreak), successor))
+                    if graph is not None:
+                        graph.add_edge(_DECODED[state], _DECODED[successor], action=str(action))
         return None, graph
 
+    @staticmethod
+    def _reconstruct_path(came_from, state):
+        """
+        Rebuild the list of actions leading to 'state' by following parent pointers.
+
+        Args:
+            came_from (dict): Maps each state to (parent_state, action); the initial
+                              state maps to (None, None).
+            state (int): The packed state the path ends at.
+
+        Returns:
+            list: The actions from the initial state to 'state', in order.
+        """
+        actions = []
+        parent, action = came_from[state]
+        while parent is not None:
+            actions.append(action)
+            parent, action = came_from[parent]
+        actions.reverse()
+        return actions
+
     def visualize_solution(self, graph, title):
         """
         Visualize the state transition graph using NetworkX and Matplotlib.
@@ -197,9 +303,13 @@ class MissionariesAndCannibals:
             graph (nx.DiGraph): The state transition graph.
             title (str): The title for the plot.
         """
-        plt.figure(figsize=(10, 6))
-        # Generate positions using spring layout
-        pos = nx.spring_layout(graph)
+        import matplotlib.pyplot as plt
+        import networkx as nx
+
+        plt.figure(figsize=(10, 8))
+        # Fixed grid layout: x from missionaries, y from cannibals, with boat-side-1
+        # states half a row above; the figure is tall enough that the nodes don't touch.
+        pos = {(m, c, b): (m, c + 0.5 * b) for (m, c, b) in graph.nodes()}
         # Create labels for nodes and edges
         node_labels = {node: str(node) for node in graph.nodes()}
         edge_labels = {(u, v): d['action'] for u, v, d in graph.edges(data=True)}
@@ -222,19 +332,19 @@ def main():
 
     # Breadth-First Search
     print("Breadth-First Search Solution:")
-    bfs_solution, bfs_graph = problem.breadth_first_search()
+    bfs_solution, bfs_graph = problem.breadth_first_search(build_graph=True)
     print("Solution Moves:", bfs_solution)
     problem.visualize_solution(bfs_graph, "BFS State Transition Graph")
 
     # Depth-First Search
     print("Depth-First Search Solution:")
-    dfs_solution, dfs_graph = problem.depth_first_search()
+    dfs_solution, dfs_graph = problem.depth_first_search(build_graph=True)
     print("Solution Moves:", dfs_solution)
     problem.visualize_solution(dfs_graph, "DFS State Transition Graph")
 
     # A* Search
     print("A* Search Solution:")
-    a_star_solution, a_star_graph = problem.a_star_search()
+    a_star_solution, a_star_graph = problem.a_star_search(build_graph=True)
     print("Solution Moves:", a_star_solution)
     problem.visualize_solution(a_star_graph, "A* State Transition Graph")
 
@@ -19,6 +19,11 @@ Usage Example:
 """
 
 from .figure_3_31_env import build_figure_3_31_env
-from .geometry import segments_intersect, point_in_polygon, sample_line, line_clear
-from .search_problem import ConvexPolygonPathProblem, run_searches
+from .geometry import (segments_intersect, polygon_edge_arrays, PolygonEdges,
+                       point_in_polygon, sample_line, sample_line_array,
+                       line_clear, line_clear_batch, polygon_bboxes,
+                       OccupancyGrid, occupancy_grid, segments_near_obstacles)
+from .search_problem import (ConvexPolygonPathProblem, run_searches,
+                             bidirectional_bfs, bidirectional_astar_search,
+                             bucket_astar_search)
 from .state_space import StateSpace, Vertex
@@ -0,0 +1,142 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+_geometry_fast.pyx
+
+Optional Cython build of the batched line-clearance test in geometry.py,
+for installs without Numba. Uses the same tests and arithmetic as
+geometry._segment_clear, so results match it exactly.
+
+Build it in place (needs Cython and a C compiler):
+    python shortest_path/setup_geometry_fast.py build_ext --inplace
+(run from src/). geometry.line_clear_batch picks it up automatically.
+"""
+
+import numpy as np
+
+from libc.math cimport fabs
+
+
+cdef inline int _orientation(double ax, double ay, double bx, double by,
+                             double cx, double cy) noexcept nogil:
+    """Orientation of (a, b, c): 0 collinear, 1 clockwise, 2 counterclockwise."""
+    cdef double val = (by - ay) * (cx - bx) - (bx - ax) * (cy - by)
+    if fabs(val) < 1e-9:
+        return 0
+    return 1 if val > 0 else 2
+
+
+cdef inline bint _on_segment(double ax, double ay, double bx, double by,
+                             double cx, double cy) noexcept nogil:
+    """True if b lies within the bounding box of a->c."""
+    return (min(ax, cx) <= bx <= max(ax, cx) and
+            min(ay, cy) <= by <= max(ay, cy))
+
+
+cdef inline bint _segments_intersect(double p1x, double p1y, double q1x, double q1y,
+                                     double p2x, double p2y, double q2x, double q2y) noexcept nogil:
+    """True if segments p1->q1 and p2->q2 intersect."""
+    cdef int o1 = _orientation(p1x, p1y, q1x, q1y, p2x, p2y)
+    cdef int o2 = _orientation(p1x, p1y, q1x, q1y, q2x, q2y)
+    cdef int o3 = _orientation(p2x, p2y, q2x, q2y, p1x, p1y)
+    cdef int o4 = _orientation(p2x, p2y, q2x, q2y, q1x, q1y)
+
+    if o1 != o2 and o3 != o4:
+        return True
+    if o1 == 0 and _on_segment(p1x, p1y, p2x, p2y, q1x, q1y):
+        return True
+    if o2 == 0 and _on_segment(p1x, p1y, q2x, q2y, q1x, q1y):
+        return True
+    if o3 == 0 and _on_segment(p2x, p2y, p1x, p1y, q2x, q2y):
+        return True
+    if o4 == 0 and _on_segment(p2x, p2y, q1x, q1y, q2x, q2y):
+        return True
+    return False
+
+
+cpdef bint line_clear_c(double x1, double y1, double x2, double y2,
+                        const double[::1] xs, const double[::1] ys,
+                        const double[::1] dx_over_dy, const double[::1] x_at_ref,
+                        const long long[::1] starts, const long long[::1] lens,
+                        const double[::1] boxes, const double[::1] centroids, int samples,
+                        long long[::1] order, double[::1] dist) noexcept nogil:
+    """
+    line_clear for the segment (x1, y1)->(x2, y2) against the polygons packed
+    by geometry.polygon_edge_arrays, skipping those whose box misses the
+    segment's and testing the rest nearest centroid first. 'order' and 'dist'
+    are scratch buffers with one slot per polygon. Mirrors
+    geometry._segment_clear.
+    """
+    cdef double sx_min = min(x1, x2), sx_max = max(x1, x2)
+    cdef double sy_min = min(y1, y2), sy_max = max(y1, y2)
+    cdef double mx = 0.5 * (x1 + x2), my = 0.5 * (y1 + y2)
+    cdef double v1x, v1y, v2x, v2y, t, x, y, d
+    cdef long long k, b, e, start, n, i, j, m, r
+    cdef int s
+    cdef bint inside
+
+    # Insertion-sort the polygons that pass the box test by centroid distance.
+    m = 0
+    for k in range(starts.shape[0]):
+        b = 4 * k
+        if not (sx_min <= boxes[b + 2] and sx_max >= boxes[b] and
+                sy_min <= boxes[b + 3] and sy_max >= boxes[b + 1]):
+            continue
+        d = (centroids[2 * k] - mx) ** 2 + (centroids[2 * k + 1] - my) ** 2
+        r = m
+        while r > 0 and dist[r - 1] > d:
+            order[r], dist[r] = order[r - 1], dist[r - 1]
+            r -= 1
+        order[r], dist[r] = k, d
+        m += 1
+
+    for r in range(m):
+        k = order[r]
+        start, n = starts[k], lens[k]
+
+        # 1) Check intersections with polygon edges (edges sharing an endpoint are skipped)
+        for e in range(n):
+            i = start + e
+            j = start + (e + 1) % n
+            v1x, v1y, v2x, v2y = xs[i], ys[i], xs[j], ys[j]
+            if ((v1x == x1 and v1y == y1) or (v1x == x2 and v1y == y2) or
+                    (v2x == x1 and v2y == y1) or (v2x == x2 and v2y == y2)):
+                continue
+            if _segments_intersect(x1, y1, x2, y2, v1x, v1y, v2x, v2y):
+                return False
+
+        # 2) Check sample points for interior crossing
+        for s in range(1, samples):
+            t = <double>s / samples
+            x = x1 + t * (x2 - x1)
+            y = y1 + t * (y2 - y1)
+            inside = False
+            for e in range(n):
+                i = start + e
+                j = start + (e + 1) % n
+                if (ys[i] > y) != (ys[j] > y):
+                    if x_at_ref[i] + y * dx_over_dy[i] > x:
+                        inside = not inside
+            if inside:
+                return False
+    return True
+
+
+def line_clear_batch_c(const double[:, ::1] segs, const double[::1] xs, const double[::1] ys,
+                       const double[::1] dx_over_dy, const double[::1] x_at_ref,
+                       const long long[::1] starts, const long long[::1] lens,
+                       const double[::1] boxes, const double[::1] centroids, int samples):
+    """
+    line_clear_c over every row (x1, y1, x2, y2) of 'segs'; returns a
+    boolean array of shape (M,).
+    """
+    clear = np.empty(segs.shape[0], dtype=np.bool_)
+    cdef unsigned char[::1] out = clear.view(np.uint8)
+    cdef long long[::1] order = np.empty(starts.shape[0], dtype=np.int64)
+    cdef double[::1] dist = np.empty(starts.shape[0], dtype=np.float64)
+    cdef Py_ssize_t s
+    with nogil:
+        for s in range(segs.shape[0]):
+            out[s] = line_clear_c(segs[s, 0], segs[s, 1], segs[s, 2], segs[s, 3],
+                                  xs, ys, dx_over_dy, x_at_ref, starts, lens, boxes,
+                                  centroids, samples, order, dist)
+    return clear
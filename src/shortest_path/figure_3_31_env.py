@@ -8,103 +8,86 @@ and manual cross-polygon edges are asserted as specified.
 
 from .state_space import StateSpace
 
+# Obstacle polygons as (shape_label, ((vertex_name, x, y), ...)), with
+# vertices listed in boundary order
+FIGURE_3_31_POLYGONS = (
+    ("Rect1", (("rec1", 0.5, 0.0), ("rec2", 0.5, 1.4), ("rec3", 4.6, 1.4),
+               ("rec4", 4.6, 0.0))),
+    ("Pent", (("pent1", 1.7, 2.0), ("pent2", 0.3, 2.3), ("pent3", 0.0, 3.8),
+              ("pent4", 1.5, 5.1), ("pent5", 2.6, 3.7))),
+    ("Tri1", (("tri1", 2.5, 1.8), ("tri2", 3.1, 4.0), ("tri3", 3.7, 1.8))),
+    ("Quad1", (("quad1", 3.9, 3.3), ("quad2", 3.7, 4.9), ("quad3", 4.8, 5.1),
+               ("quad4", 5.7, 4.4))),
+    ("Tri2", (("tri_2_1", 5.4, 0.7), ("tri_2_2", 4.9, 2.6), ("tri_2_3", 6.3, 1.5))),
+    ("Rect2", (("rec_2_1", 5.8, 2.2), ("rec_2_2", 5.8, 5.0), ("rec_2_3", 7.5, 5.0),
+               ("rec_2_4", 7.5, 2.2))),
+    ("Hex", (("hex1", 7.7, 0.0), ("hex2", 6.8, 0.6), ("hex3", 6.8, 1.5),
+             ("hex4", 7.7, 2.2), ("hex5", 8.5, 1.5), ("hex6", 8.5, 0.4))),
+    ("Quad2", (("quad_2_1", 8.7, 1.8), ("quad_2_2", 7.8, 4.7), ("quad_2_3", 8.6, 5.0),
+               ("quad_2_4", 8.9, 4.5))),
+)
+
+# Manually asserted cross-polygon edges, as (src, dst) pairs
+# (Matches your snippet for Figure 3.31)
+CROSS_POLYGON_EDGES = [
+    ("S", "rec1"), ("S", "rec2"), ("S", "pent2"), ("S", "pent3"),
+    ("rec1", "pent2"), ("rec1", "pent3"),
+    ("rec2", "pent1"), ("rec2", "pent2"), ("rec2", "tri1"), ("rec2", "tri3"),
+    ("rec3", "pent1"), ("rec3", "tri1"), ("rec3", "tri2"), ("rec3", "tri3"), ("rec3", "quad1"),
+    ("rec3", "tri_2_1"), ("rec3", "tri_2_2"),
+    ("rec4", "tri_2_1"), ("rec4", "tri_2_2"), ("rec4", "tri_2_3"), ("rec4", "hex1"),
+    ("rec4", "hex2"), ("rec4", "hex3"), ("rec4", "rec_2_4"),
+    ("pent1", "tri1"), ("pent1", "tri2"),
+    ("pent4", "tri2"), ("pent4", "quad2"), ("pent4", "quad3"),
+    ("pent5", "tri1"), ("pent5", "tri2"), ("pent5", "quad2"),
+    ("tri2", "quad1"), ("tri2", "quad2"), ("tri2", "tri_2_1"),
+    ("tri3", "quad1"), ("tri3", "quad2"), ("tri3", "quad4"), ("tri3", "tri_2_2"),
+    ("quad1", "tri_2_1"), ("quad1", "tri_2_2"), ("quad1", "rec_2_1"),
+    ("quad3", "rec_2_2"), ("quad3", "rec_2_3"), ("quad3", "quad_2_3"),
+    ("quad4", "tri_2_2"), ("quad4", "rec_2_1"), ("quad4", "rec_2_2"),
+    ("tri_2_1", "rec_2_4"), ("tri_2_1", "hex1"), ("tri_2_1", "hex2"), ("tri_2_1", "hex3"),
+    ("tri_2_1", "hex4"),
+    ("tri_2_2", "rec_2_1"), ("tri_2_2", "hex3"),
+    ("tri_2_3", "rec_2_1"), ("tri_2_3", "rec_2_4"), ("tri_2_3", "hex2"), ("tri_2_3", "hex3"),
+    ("tri_2_3", "hex4"),
+    ("rec_2_1", "hex3"), ("rec_2_1", "hex4"),
+    ("rec_2_2", "quad_2_3"),
+    ("rec_2_3", "quad_2_1"), ("rec_2_3", "quad_2_2"), ("rec_2_3", "quad_2_3"),
+    ("rec_2_3", "hex4"), ("rec_2_3", "hex5"),
+    ("rec_2_4", "hex3"), ("rec_2_4", "hex4"), ("rec_2_4", "quad_2_1"), ("rec_2_4", "quad_2_2"),
+    ("hex4", "quad_2_1"), ("hex4", "quad_2_2"),
+    ("hex5", "quad_2_1"), ("hex5", "quad_2_2"),
+    ("hex6", "quad_2_1"), ("hex6", "G"),
+    ("quad_2_1", "G"),
+    ("quad_2_3", "G"),
+    ("quad_2_4", "G"),
+]
+
+
 def build_figure_3_31_env():
     """
     Construct and return a StateSpace object that replicates
     Figure 3.31 with polygons and manually asserted cross-polygon edges.
+
+    The layout lives in the module-level FIGURE_3_31_POLYGONS and
+    CROSS_POLYGON_EDGES tables; each call builds a fresh StateSpace from
+    them, so callers may add connections to the result freely.
     """
     env = StateSpace()
 
     # Start
     env.set_start(0.0, 0.7, "S")
 
-    # Rectangle
-    env.add_vertex(0.5, 0.0, "rec1")
-    env.add_vertex(0.5, 1.4, "rec2")
-    env.add_vertex(4.6, 1.4, "rec3")
-    env.add_vertex(4.6, 0.0, "rec4")
-    env.connect_polygon(["rec1", "rec2", "rec3", "rec4"], shape_label="Rect1")
-
-    # Pentagon
-    env.add_vertex(1.7, 2.0, "pent1")
-    env.add_vertex(0.3, 2.3, "pent2")
-    env.add_vertex(0.0, 3.8, "pent3")
-    env.add_vertex(1.5, 5.1, "pent4")
-    env.add_vertex(2.6, 3.7, "pent5")
-    env.connect_polygon(["pent1", "pent2", "pent3", "pent4", "pent5"], shape_label="Pent")
-
-    # Triangle
-    env.add_vertex(2.5, 1.8, "tri1")
-    env.add_vertex(3.1, 4.0, "tri2")
-    env.add_vertex(3.7, 1.8, "tri3")
-    env.connect_polygon(["tri1", "tri2", "tri3"], shape_label="Tri1")
-
-    # Quadrilateral
-    env.add_vertex(3.9, 3.3, "quad1")
-    env.add_vertex(3.7, 4.9, "quad2")
-    env.add_vertex(4.8, 5.1, "quad3")
-    env.add_vertex(5.7, 4.4, "quad4")
-    env.connect_polygon(["quad1", "quad2", "quad3", "quad4"], shape_label="Quad1")
-
-    # Triangle 2
-    env.add_vertex(5.4, 0.7, "tri_2_1")
-    env.add_vertex(4.9, 2.6, "tri_2_2")
-    env.add_vertex(6.3, 1.5, "tri_2_3")
-    env.connect_polygon(["tri_2_1", "tri_2_2", "tri_2_3"], shape_label="Tri2")
-
-    # Rectangle 2
-    env.add_vertex(5.8, 2.2, "rec_2_1")
-    env.add_vertex(5.8, 5.0, "rec_2_2")
-    env.add_vertex(7.5, 5.0, "rec_2_3")
-    env.add_vertex(7.5, 2.2, "rec_2_4")
-    env.connect_polygon(["rec_2_1", "rec_2_2", "rec_2_3", "rec_2_4"], shape_label="Rect2")
-
-    # Hexagon
-    env.add_vertex(7.7, 0.0, "hex1")
-    env.add_vertex(6.8, 0.6, "hex2")
-    env.add_vertex(6.8, 1.5, "hex3")
-    env.add_vertex(7.7, 2.2, "hex4")
-    env.add_vertex(8.5, 1.5, "hex5")
-    env.add_vertex(8.5, 0.4, "hex6")
-    env.connect_polygon(["hex1", "hex2", "hex3", "hex4", "hex5", "hex6"], shape_label="Hex")
-
-    # Quadrilateral 2
-    env.add_vertex(8.7, 1.8, "quad_2_1")
-    env.add_vertex(7.8, 4.7, "quad_2_2")
-    env.add_vertex(8.6, 5.0, "quad_2_3")
-    env.add_vertex(8.9, 4.5, "quad_2_4")
-    env.connect_polygon(["quad_2_1", "quad_2_2", "quad_2_3", "quad_2_4"], shape_label="Quad2")
+    # Obstacle polygons
+    for label, vertices in FIGURE_3_31_POLYGONS:
+        for name, x, y in vertices:
+            env.add_vertex(x, y, name)
+        env.connect_polygon([name for name, _, _ in vertices], shape_label=label)
 
     # Goal
     env.set_goal(9.1, 5.0, "G")
 
     # Manually assert cross-polygon edges
-    # (Matches your snippet for Figure 3.31)
-    env.assert_reachable("S", ["rec1", "rec2", "pent2", "pent3"])
-    env.assert_reachable("rec1", ["pent2", "pent3"])
-    env.assert_reachable("rec2", ["pent1", "pent2", "tri1", "tri3"])
-    env.assert_reachable("rec3", ["pent1", "tri1", "tri2", "tri3", "quad1", "tri_2_1", "tri_2_2"])
-    env.assert_reachable("rec4", ["tri_2_1", "tri_2_2", "tri_2_3", "hex1", "hex2", "hex3", "rec_2_4"])
-    env.assert_reachable("pent1", ["tri1", "tri2"])
-    env.assert_reachable("pent4", ["tri2", "quad2", "quad3"])
-    env.assert_reachable("pent5", ["tri1", "tri2", "quad2"])
-    env.assert_reachable("tri2", ["quad1", "quad2", "tri_2_1"])
-    env.assert_reachable("tri3", ["quad1", "quad2", "quad4", "tri_2_2"])
-    env.assert_reachable("quad1", ["tri_2_1", "tri_2_2", "rec_2_1"])
-    env.assert_reachable("quad3", ["rec_2_2", "rec_2_3", "quad_2_3"])
-    env.assert_reachable("quad4", ["tri_2_2", "rec_2_1", "rec_2_2"])
-    env.assert_reachable("tri_2_1", ["rec_2_4", "hex1", "hex2", "hex3", "hex4"])
-    env.assert_reachable("tri_2_2", ["rec_2_1", "hex3"])
-    env.assert_reachable("tri_2_3", ["rec_2_1", "rec_2_4", "hex2", "hex3", "hex4"])
-    env.assert_reachable("rec_2_1", ["hex3", "hex4"])
-    env.assert_reachable("rec_2_2", "quad_2_3")
-    env.assert_reachable("rec_2_3", ["quad_2_1", "quad_2_2", "quad_2_3", "hex4", "hex5"])
-    env.assert_reachable("rec_2_4", ["hex3", "hex4", "quad_2_1", "quad_2_2"])
-    env.assert_reachable("hex4", ["quad_2_1", "quad_2_2"])
-    env.assert_reachable("hex5", ["quad_2_1", "quad_2_2"])
-    env.assert_reachable("hex6", ["quad_2_1", "G"])
-    env.assert_reachable("quad_2_1", "G")
-    env.assert_reachable("quad_2_3", "G")
-    env.assert_reachable("quad_2_4", "G")
+    env.assert_reachable_bulk(CROSS_POLYGON_EDGES)
 
     return env
@@ -4,44 +4,151 @@ geometry.py
 PEP 8–compliant geometry utilities for intersection checks and
 point-in-polygon logic. Also includes sampling along a line for
 robust interior checks, if needed for automated edge generation.
+
+The scalar kernels, including the one line_clear runs, are compiled with
+Numba when it is installed; otherwise they run as plain Python with the same
+results. line_clear_batch tests many segments in one compiled call (the
+optional Cython extension _geometry_fast if it has been built, else Numba).
 """
 
 import math
+from collections import namedtuple
 
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional.
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+try:  # Optional Cython build of line_clear_batch; see setup_geometry_fast.py.
+    from ._geometry_fast import line_clear_batch_c
+    CYTHON_AVAILABLE = True
+except ImportError:
+    CYTHON_AVAILABLE = False
 
-def segments_intersect(p1, q1, p2, q2):
-    """
-    Return True if line segments p1->q1 and p2->q2 intersect.
-    Uses orientation tests and on-segment checks.
-    """
-    def orientation(a, b, c):
-        val = (b[1] - a[1]) * (c[0] - b[0]) - (b[0] - a[0]) * (c[1] - b[1])
-        if abs(val) < 1e-9:
-            return 0
-        return 1 if val > 0 else 2
 
-    def on_segment(a, b, c):
-        return (min(a[0], c[0]) <= b[0] <= max(a[0], c[0]) and
-                min(a[1], c[1]) <= b[1] <= max(a[1], c[1]))
+@njit(cache=True)
+def _orientation(ax, ay, bx, by, cx, cy):
+    """Orientation of (a, b, c): 0 collinear, 1 clockwise, 2 counterclockwise."""
+    val = (by - ay) * (cx - bx) - (bx - ax) * (cy - by)
+    if abs(val) < 1e-9:
+        return 0
+    return 1 if val > 0 else 2
 
-    o1 = orientation(p1, q1, p2)
-    o2 = orientation(p1, q1, q2)
-    o3 = orientation(p2, q2, p1)
-    o4 = orientation(p2, q2, q1)
+
+@njit(cache=True)
+def _on_segment(ax, ay, bx, by, cx, cy):
+    """True if b lies within the bounding box of a->c."""
+    return (min(ax, cx) <= bx <= max(ax, cx) and
+            min(ay, cy) <= by <= max(ay, cy))
+
+
+@njit(cache=True)
+def _segments_intersect(p1x, p1y, q1x, q1y, p2x, p2y, q2x, q2y):
+    """Scalar-argument kernel behind segments_intersect."""
+    o1 = _orientation(p1x, p1y, q1x, q1y, p2x, p2y)
+    o2 = _orientation(p1x, p1y, q1x, q1y, q2x, q2y)
+    o3 = _orientation(p2x, p2y, q2x, q2y, p1x, p1y)
+    o4 = _orientation(p2x, p2y, q2x, q2y, q1x, q1y)
 
     if o1 != o2 and o3 != o4:
         return True
-    if o1 == 0 and on_segment(p1, p2, q1):
+    if o1 == 0 and _on_segment(p1x, p1y, p2x, p2y, q1x, q1y):
         return True
-    if o2 == 0 and on_segment(p1, q2, q1):
+    if o2 == 0 and _on_segment(p1x, p1y, q2x, q2y, q1x, q1y):
         return True
-    if o3 == 0 and on_segment(p2, p1, q2):
+    if o3 == 0 and _on_segment(p2x, p2y, p1x, p1y, q2x, q2y):
         return True
-    if o4 == 0 and on_segment(p2, q1, q2):
+    if o4 == 0 and _on_segment(p2x, p2y, q1x, q1y, q2x, q2y):
         return True
     return False
 
 
+def segments_intersect(p1, q1, p2, q2):
+    """
+    Return True if line segments p1->q1 and p2->q2 intersect.
+    Uses orientation tests and on-segment checks.
+    """
+    return bool(_segments_intersect(float(p1[0]), float(p1[1]), float(q1[0]), float(q1[1]),
+                                    float(p2[0]), float(p2[1]), float(q2[0]), float(q2[1])))
+
+
+def polygon_bboxes(polygons):
+    """
+    Axis-aligned bounding boxes of polygons (lists of (x, y) vertices), as an
+    array of shape (P, 2, 2) where [k, 0] is polygon k's (xmin, ymin) and
+    [k, 1] its (xmax, ymax). Empty polygons are dropped.
+    """
+    boxes = [(np.min(poly, axis=0), np.max(poly, axis=0))
+             for poly in (np.asarray(p, dtype=np.float64).reshape(-1, 2) for p in polygons)
+             if len(poly)]
+    return np.array(boxes, dtype=np.float64).reshape(-1, 2, 2)
+
+
+# Polygons packed for the line_clear kernel; see polygon_edge_arrays.
+PolygonEdges = namedtuple('PolygonEdges', ['xs', 'ys', 'dx_over_dy', 'x_at_ref',
+                                           'starts', 'lens', 'boxes', 'centroids'])
+
+
+def polygon_edge_arrays(polygons):
+    """
+    Pack polygons (lists of (x, y) vertices) for the line_clear kernel:
+    the vertex coordinates 'xs' and 'ys' of all polygons back to back,
+    each polygon's first vertex index 'starts' and vertex count 'lens'
+    (its edges run from each vertex to the next, wrapping around), and
+    'boxes' with polygon k's (xmin, ymin, xmax, ymax) at [4k:4k + 4]
+    and 'centroids' with the (x, y) mean of its vertices at [2k:2k + 2].
+    For the edge leaving vertex i, 'dx_over_dy' holds its inverse slope and
+    'x_at_ref' the x where its line crosses y = 0, so a ray at height y
+    crosses it at x_at_ref[i] + y * dx_over_dy[i] without a division
+    (both are 0 for horizontal edges, which a ray never straddles).
+    Empty polygons are dropped. The columns are NumPy arrays when Numba is
+    installed and plain lists otherwise, whichever the kernel reads fastest.
+    Build these once and pass them to line_clear to skip repacking.
+    """
+    polygons = [poly for poly in polygons if len(poly)]
+    xs = [float(x) for poly in polygons for x, _ in poly]
+    ys = [float(y) for poly in polygons for _, y in poly]
+    lens = [len(poly) for poly in polygons]
+    starts = [0] * len(polygons)
+    for k in range(1, len(polygons)):
+        starts[k] = starts[k - 1] + lens[k - 1]
+    dx_over_dy = [0.0] * len(xs)
+    x_at_ref = [0.0] * len(xs)
+    for start, n in zip(starts, lens):
+        for e in range(n):
+            i, j = start + e, start + (e + 1) % n
+            if ys[i] != ys[j]:
+                dx_over_dy[i] = (xs[j] - xs[i]) / (ys[j] - ys[i])
+                x_at_ref[i] = xs[i] - ys[i] * dx_over_dy[i]
+    boxes = polygon_bboxes(polygons).reshape(-1).tolist()
+    centroids = []
+    for start, n in zip(starts, lens):
+        centroids += [sum(xs[start:start + n]) / n, sum(ys[start:start + n]) / n]
+    if NUMBA_AVAILABLE:
+        return PolygonEdges(*(np.array(col, dtype=np.float64)
+                              for col in (xs, ys, dx_over_dy, x_at_ref)),
+                            np.array(starts, dtype=np.int64), np.array(lens, dtype=np.int64),
+                            np.array(boxes, dtype=np.float64),
+                            np.array(centroids, dtype=np.float64))
+    return PolygonEdges(xs, ys, dx_over_dy, x_at_ref, starts, lens, boxes, centroids)
+
+
+def _order_scratch(edges):
+    """Work buffers for _segment_clear's polygon ordering, one slot per polygon."""
+    if NUMBA_AVAILABLE:
+        return np.empty(len(edges.starts), dtype=np.int64), np.empty(len(edges.starts))
+    return [0] * len(edges.starts), [0.0] * len(edges.starts)
+
+
 def point_in_polygon(point, polygon):
     """
     Ray-casting algorithm to determine if 'point' is inside 'polygon'.
@@ -60,39 +167,185 @@ def point_in_polygon(point, polygon):
     return inside
 
 
+def sample_line_array(p1, p2, num_samples=5):
+    """
+    Return the intermediate sample points along the line from p1->p2,
+    excluding the endpoints, as an array of shape (num_samples - 1, 2).
+    """
+    p1 = np.asarray(p1, dtype=np.float64)
+    p2 = np.asarray(p2, dtype=np.float64)
+    t = np.arange(1, max(num_samples, 1), dtype=np.float64) / num_samples
+    return p1 + t[:, None] * (p2 - p1)
+
+
 def sample_line(p1, p2, num_samples=5):
     """
     Yield intermediate sample points along the line from p1->p2,
     excluding the endpoints, for robust interior checks.
     """
-    for i in range(1, num_samples):
-        t = i / num_samples
-        x = p1[0] + t * (p2[0] - p1[0])
-        y = p1[1] + t * (p2[1] - p1[1])
+    for x, y in sample_line_array(p1, p2, num_samples).tolist():
         yield (x, y)
 
 
-def line_clear(p1, p2, polygons, num_samples=5):
+@njit(cache=True)
+def _segment_clear(p1x, p1y, p2x, p2y, xs, ys, dx_over_dy, x_at_ref, starts, lens, boxes,
+                   centroids, samples, order, dist):
+    """
+    The line_clear test for one segment against polygons packed by
+    polygon_edge_arrays. Compiled by Numba when it is installed and run as
+    plain Python on the packed lists otherwise, so both paths share this one
+    implementation. Polygons whose bounding box misses the segment's are
+    skipped; the rest are tested nearest centroid to the segment's midpoint
+    first, as those are the likeliest to block it and end the test early.
+    'order' and 'dist' are scratch buffers from _order_scratch.
+    """
+    sx_min, sx_max = min(p1x, p2x), max(p1x, p2x)
+    sy_min, sy_max = min(p1y, p2y), max(p1y, p2y)
+    mx, my = 0.5 * (p1x + p2x), 0.5 * (p1y + p2y)
+
+    # Insertion-sort the polygons that pass the box test by centroid distance.
+    m = 0
+    for k in range(len(starts)):
+        b = 4 * k
+        if not (sx_min <= boxes[b + 2] and sx_max >= boxes[b] and
+                sy_min <= boxes[b + 3] and sy_max >= boxes[b + 1]):
+            continue
+        d = (centroids[2 * k] - mx) ** 2 + (centroids[2 * k + 1] - my) ** 2
+        r = m
+        while r > 0 and dist[r - 1] > d:
+            order[r], dist[r] = order[r - 1], dist[r - 1]
+            r -= 1
+        order[r], dist[r] = k, d
+        m += 1
+
+    for r in range(m):
+        k = order[r]
+        start, n = starts[k], lens[k]
+
+        # 1) Check intersections with polygon edges (edges sharing an endpoint are skipped)
+        for e in range(n):
+            i, j = start + e, start + (e + 1) % n
+            v1x, v1y, v2x, v2y = xs[i], ys[i], xs[j], ys[j]
+            if ((v1x == p1x and v1y == p1y) or (v1x == p2x and v1y == p2y) or
+                    (v2x == p1x and v2y == p1y) or (v2x == p2x and v2y == p2y)):
+                continue
+            if _segments_intersect(p1x, p1y, p2x, p2y, v1x, v1y, v2x, v2y):
+                return False
+
+        # 2) Check sample points for interior crossing
+        for s in range(1, samples):
+            t = s / samples
+            x = p1x + t * (p2x - p1x)
+            y = p1y + t * (p2y - p1y)
+            inside = False
+            for e in range(n):
+                i, j = start + e, start + (e + 1) % n
+                if (ys[i] > y) != (ys[j] > y):
+                    if x_at_ref[i] + y * dx_over_dy[i] > x:
+                        inside = not inside
+            if inside:
+                return False
+    return True
+
+
+def line_clear(p1, p2, polygons, num_samples=5, edges=None):
     """
     Returns True if the line from p1->p2 does not intersect any polygon edges
     and none of the interior sample points lie inside a polygon.
     This is optional for automated edge generation, not required if you only
     rely on manual edges.
+    'edges' may hold the PolygonEdges from polygon_edge_arrays(polygons);
+    they are computed on the fly otherwise.
     """
-    # 1) Check intersections with polygon edges
-    for poly in polygons:
-        n = len(poly)
-        for i in range(n):
-            v1, v2 = poly[i], poly[(i + 1) % n]
-            if v1 == p1 or v1 == p2 or v2 == p1 or v2 == p2:
-                continue
-            if segments_intersect(p1, p2, v1, v2):
-                return False
+    if edges is None:
+        edges = polygon_edge_arrays(polygons)
+    return bool(_segment_clear(float(p1[0]), float(p1[1]), float(p2[0]), float(p2[1]),
+                               *edges, num_samples, *_order_scratch(edges)))
 
-    # 2) Check sample points for interior crossing
-    for pt in sample_line(p1, p2, num_samples):
-        for poly in polygons:
-            if point_in_polygon(pt, poly):
-                return False
 
-    return True
+# Coarse occupancy of polygon bounding boxes; see occupancy_grid.
+OccupancyGrid = namedtuple('OccupancyGrid', ['sat', 'lo', 'hi', 'cell'])
+
+
+def _grid_cells(grid, points):
+    """(x, y) cell indices of 'points' (shape (N, 2)), clamped to the grid."""
+    n = grid.sat.shape[0] - 1
+    return np.clip(np.floor((points - grid.lo) / grid.cell).astype(np.intp), 0, n - 1)
+
+
+def occupancy_grid(bbox, resolution=64):
+    """
+    Rasterize polygon bounding boxes ('bbox', from polygon_bboxes) onto a
+    resolution x resolution grid over their combined extent. A cell is
+    occupied if any box touches it; the grid is stored as a summed-area
+    table 'sat' of shape (resolution + 1, resolution + 1) so the occupied
+    cells in any rectangle of cells can be counted in O(1).
+    """
+    occ = np.zeros((resolution, resolution), dtype=np.intp)
+    if len(bbox):
+        lo, hi = bbox[:, 0].min(axis=0), bbox[:, 1].max(axis=0)
+    else:
+        lo, hi = np.zeros(2), np.zeros(2)
+    cell = (hi - lo) / resolution
+    cell[cell <= 0] = 1.0  # Degenerate extent: any positive size will do.
+    sat = np.zeros((resolution + 1, resolution + 1), dtype=np.intp)
+    grid = OccupancyGrid(sat, lo, hi, cell)
+    if len(bbox):
+        c0, c1 = _grid_cells(grid, bbox[:, 0]), _grid_cells(grid, bbox[:, 1])
+        for (x0, y0), (x1, y1) in zip(c0.tolist(), c1.tolist()):
+            occ[y0:y1 + 1, x0:x1 + 1] = 1
+        sat[1:, 1:] = occ.cumsum(axis=0).cumsum(axis=1)
+    return grid
+
+
+def segments_near_obstacles(segs, grid):
+    """
+    Boolean array of shape (M,): False where the bounding box of segment row
+    (x1, y1, x2, y2) of 'segs' covers only empty cells of 'grid' (from
+    occupancy_grid), so it cannot touch any polygon and is clear. True
+    segments still need the full line_clear test.
+    """
+    lo = np.minimum(segs[:, :2], segs[:, 2:])
+    hi = np.maximum(segs[:, :2], segs[:, 2:])
+    inside = (hi >= grid.lo).all(axis=1) & (lo <= grid.hi).all(axis=1)
+    (x0, y0), (x1, y1) = _grid_cells(grid, lo).T, _grid_cells(grid, hi).T
+    sat = grid.sat
+    occupied = sat[y1 + 1, x1 + 1] - sat[y0, x1 + 1] - sat[y1 + 1, x0] + sat[y0, x0]
+    return inside & (occupied > 0)
+
+
+@njit(cache=True)
+def _line_clear_batch(segs, xs, ys, dx_over_dy, x_at_ref, starts, lens, boxes, centroids,
+                      samples, order, dist):
+    """Compiled _segment_clear over every row (x1, y1, x2, y2) of 'segs'."""
+    clear = np.ones(segs.shape[0], dtype=np.bool_)
+    for s in range(segs.shape[0]):
+        clear[s] = _segment_clear(segs[s, 0], segs[s, 1], segs[s, 2], segs[s, 3],
+                                  xs, ys, dx_over_dy, x_at_ref, starts, lens, boxes,
+                                  centroids, samples, order, dist)
+    return clear
+
+
+def line_clear_batch(segs, polygons, num_samples=5, edges=None):
+    """
+    Apply line_clear to every segment in 'segs', an array of shape (M, 4)
+    with rows (x1, y1, x2, y2). Returns a boolean array of shape (M,).
+    'edges' may hold the PolygonEdges from polygon_edge_arrays(polygons).
+    With the Cython extension built, or Numba installed, this is one compiled
+    call over all segments; otherwise it loops over them in plain Python.
+    """
+    segs = np.ascontiguousarray(segs, dtype=np.float64).reshape(-1, 4)
+    if edges is None:
+        edges = polygon_edge_arrays(polygons)
+    if CYTHON_AVAILABLE:
+        return line_clear_batch_c(segs, *(np.asarray(col, dtype=np.float64) for col in
+                                          (edges.xs, edges.ys, edges.dx_over_dy, edges.x_at_ref)),
+                                  np.asarray(edges.starts, dtype=np.int64),
+                                  np.asarray(edges.lens, dtype=np.int64),
+                                  np.asarray(edges.boxes, dtype=np.float64),
+                                  np.asarray(edges.centroids, dtype=np.float64), num_samples)
+    order, dist = _order_scratch(edges)
+    if NUMBA_AVAILABLE:
+        return _line_clear_batch(segs, *edges, num_samples, order, dist)
+    return np.array([_segment_clear(x1, y1, x2, y2, *edges, num_samples, order, dist)
+                     for x1, y1, x2, y2 in segs.tolist()], dtype=bool)
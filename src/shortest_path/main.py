@@ -4,20 +4,21 @@ main.py
 PEP 8–compliant main execution script:
  1. Builds the figure_3_31_env environment.
  2. Creates a ConvexPolygonPathProblem.
- 3. Runs BFS, DFS, UCS, A* searches.
+ 3. Runs BFS, DFS, UCS, A* searches (plus bidirectional BFS/A* and bucket-queue A*).
  4. Displays and saves visualizations for:
     - Initial state space
     - BFS solution
     - DFS solution
     - UCS solution
     - A* solution
+    - Bidirectional BFS and A* solutions
+    - Bucket-queue A* solution
 
 Usage:
     python main.py
 """
 
 import os
-import matplotlib.pyplot as plt
 
 from .figure_3_31_env import build_figure_3_31_env
 from .search_problem import ConvexPolygonPathProblem, run_searches
@@ -46,19 +47,15 @@ def visualize_solution(env, solution_path, title="Solution Path",
         filename: Descriptive filename for saving the figure.
         show: Boolean; if True, displays the figure on screen.
     """
-    fig, ax = plt.subplots()
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
 
-    # Draw polygon edges in black
-    for edge in env.polygon_edges:
-        x_vals, y_vals = edge
-        ax.plot([x_vals[0], x_vals[1]], [y_vals[0], y_vals[1]],
-                color="black", linewidth=2)
+    fig, ax = plt.subplots()
 
-    # Draw auto edges in dashed gray
-    for edge in env.auto_edges:
-        x_vals, y_vals = edge
-        ax.plot([x_vals[0], x_vals[1]], [y_vals[0], y_vals[1]],
-                color="gray", linestyle="--", linewidth=1)
+    # Draw polygon edges in black and auto edges in dashed gray
+    ax.add_collection(LineCollection(env.edge_array(), colors="black", linewidths=2))
+    ax.add_collection(LineCollection(env.auto_edges, colors="gray",
+                                     linestyles="--", linewidths=1))
 
     # Draw minimal labels for polygons
     for poly_info in env.polygons:
@@ -66,24 +63,23 @@ def visualize_solution(env, solution_path, title="Solution Path",
         label = poly_info['label']
         if not verts or not label:
             continue
-        xs = [env.vertices[v].location[0] for v in verts]
-        ys = [env.vertices[v].location[1] for v in verts]
-        cx = sum(xs) / len(xs)
-        cy = sum(ys) / len(ys)
+        cx, cy = poly_info['centroid']
         ax.text(cx, cy, label, fontsize=10, color="black", fontweight="bold",
                 horizontalalignment='center', verticalalignment='center')
 
     # Draw vertices as blue dots
-    for v in env.vertices.values():
-        ax.plot(v.location[0], v.location[1], "bo", markersize=4)
+    xs = [v.location[0] for v in env.vertices.values()]
+    ys = [v.location[1] for v in env.vertices.values()]
+    ax.scatter(xs, ys, c="b", s=16)
+    ax.autoscale_view()
 
     # Mark start and goal
     if env.start:
-        ax.plot(env.start.location[0], env.start.location[1],
-                "go", markersize=8, label="Start")
+        ax.scatter([env.start.location[0]], [env.start.location[1]],
+                   c="g", s=64, label="Start")
     if env.goal:
-        ax.plot(env.goal.location[0], env.goal.location[1],
-                "ro", markersize=8, label="Goal")
+        ax.scatter([env.goal.location[0]], [env.goal.location[1]],
+                   c="r", s=64, label="Goal")
 
     # Draw the solution path in red
     if solution_path:
@@ -96,7 +92,8 @@ def visualize_solution(env, solution_path, title="Solution Path",
     ax.set_xlabel("X")
     ax.set_ylabel("Y")
     ax.grid(True)
-    ax.legend()
+    if env.start or env.goal or solution_path:
+        ax.legend()
 
     # Save figure
     folder = ensure_visualizations_folder()
@@ -118,37 +115,36 @@ def draw_environment(env, filename="figure_3_31_state_space.png", show=True):
         filename: Descriptive filename for the saved figure.
         show: Boolean; if True, displays the figure on screen.
     """
-    fig, ax = plt.subplots()
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
 
-    # Draw polygon edges in black
-    for edge in env.polygon_edges:
-        x_vals, y_vals = edge
-        ax.plot([x_vals[0], x_vals[1]], [y_vals[0], y_vals[1]],
-                color="black", linewidth=2)
+    fig, ax = plt.subplots()
 
-    # Draw auto edges in dashed gray
-    for edge in env.auto_edges:
-        x_vals, y_vals = edge
-        ax.plot([x_vals[0], x_vals[1]], [y_vals[0], y_vals[1]],
-                color="gray", linestyle="--", linewidth=1)
+    # Draw polygon edges in black and auto edges in dashed gray
+    ax.add_collection(LineCollection(env.edge_array(), colors="black", linewidths=2))
+    ax.add_collection(LineCollection(env.auto_edges, colors="gray",
+                                     linestyles="--", linewidths=1))
 
     # Draw vertices as blue dots
-    for v in env.vertices.values():
-        ax.plot(v.location[0], v.location[1], "bo", markersize=4)
+    xs = [v.location[0] for v in env.vertices.values()]
+    ys = [v.location[1] for v in env.vertices.values()]
+    ax.scatter(xs, ys, c="b", s=16)
+    ax.autoscale_view()
 
     # Mark start and goal
     if env.start:
-        ax.plot(env.start.location[0], env.start.location[1],
-                "go", markersize=8, label="Start")
+        ax.scatter([env.start.location[0]], [env.start.location[1]],
+                   c="g", s=64, label="Start")
     if env.goal:
-        ax.plot(env.goal.location[0], env.goal.location[1],
-                "ro", markersize=8, label="Goal")
+        ax.scatter([env.goal.location[0]], [env.goal.location[1]],
+                   c="r", s=64, label="Goal")
 
     ax.set_title("State Space Environment")
     ax.set_xlabel("X")
     ax.set_ylabel("Y")
     ax.grid(True)
-    ax.legend()
+    if env.start or env.goal:
+        ax.legend()
 
     folder = ensure_visualizations_folder()
     filepath = os.path.join(folder, filename)
@@ -170,11 +166,11 @@ def main():
     # 3) Draw and save the initial state space
     draw_environment(env, filename="figure_3_31_state_space.png", show=True)
 
-    # 4) Run BFS, DFS, UCS, A*
+    # 4) Run BFS, DFS, UCS, A* and the bidirectional/bucket variants
     results = run_searches(problem)
 
     # 5) For each algorithm, print and visualize the solution
-    for algo in ["BFS", "DFS", "UCS", "A*"]:
+    for algo in ["BFS", "DFS", "UCS", "A*", "BiBFS", "BiA*", "BucketA*"]:
         path, cost = results[algo]
         print(f"=== {algo} ===")
         if path:
@@ -7,34 +7,70 @@ which extends the Berkeley 'Problem' class to handle:
  - DFS
  - UCS
  - A*
+ - Bidirectional BFS and bidirectional A*
+ - A* over a bucketed priority queue
 
-We import BFS, DFS, UCS, A* from the local berkeley_ai.search module.
+We import BFS, DFS, UCS, A* from the local berkeley_ai.search module;
+the bidirectional and bucket-queue variants are defined here.
 """
 
+import heapq
 import math
-from berkeley_ai.search import Problem, breadth_first_graph_search, depth_first_graph_search
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+
+from berkeley_ai.search import Problem, Node, breadth_first_graph_search, depth_first_graph_search
 from berkeley_ai.search import uniform_cost_search, astar_search
 
 class ConvexPolygonPathProblem(Problem):
     """
     A search problem for the figure_3_31_env-based environment.
-    States are vertex names (strings).
-    Actions are the neighbor vertex names from 'reachable'.
+    The constructor takes vertex names, but states are the integer vertex IDs
+    assigned by the StateSpace (ints hash faster than names); use
+    state_name()/state_id() to translate.
+    Actions are the neighbor vertex IDs from 'reachable'.
     """
 
     def __init__(self, initial, goal, state_space):
-        super().__init__(initial, goal)
+        super().__init__(state_space.id_of(initial), state_space.id_of(goal))
         self.state_space = state_space
+        # Snapshot adjacency and locations once, as lists indexed by vertex ID;
+        # the state space must be fully built (including any automated
+        # connections) before the problem is created.
+        state_space.finalize()
+        self._adj = [tuple(ids.tolist()) for ids in state_space.adj]
+        self._loc = [tuple(xy) for xy in state_space.loc_array.tolist()]
+        # Edge lengths never change, so compute each one once.
+        loc = self._loc
+        self._edge_cost = {(a, b): math.hypot(loc[b][0] - loc[a][0], loc[b][1] - loc[a][1])
+                           for a, neighbors in enumerate(self._adj) for b in neighbors}
+        # The heuristic measures distance to this problem's goal, which need
+        # not be the state space's own goal vertex.
+        self._goal_xy = self._loc[self.goal]
+        self._h_cache = {}
+
+    def state_id(self, name):
+        """Return the state (vertex ID) for a vertex name."""
+        return self.state_space.id_of(name)
+
+    def state_name(self, state):
+        """Return the vertex name for a state (vertex ID)."""
+        return self.state_space.name_of(state)
+
+    def num_states(self):
+        """Return the number of states (vertex IDs run from 0 to this minus one)."""
+        return len(self._adj)
 
     def actions(self, state):
         """
-        Return list of reachable vertex names from the given 'state'.
+        Return the reachable vertex IDs from the given 'state'.
         """
-        return list(self.state_space.vertices[state].reachable.values())
+        return self._adj[state]
 
     def result(self, state, action):
         """
-        The new state is simply the action, which is a neighbor's name.
+        The new state is simply the action, which is a neighbor's ID.
         """
         return action
 
@@ -44,61 +80,257 @@ class ConvexPolygonPathProblem(Problem):
     def path_cost(self, c, state1, action, state2):
         """
         Euclidean distance between state1 and state2, plus current cost.
+        The distance comes from the edge lengths precomputed in __init__.
         """
-        (x1, y1) = self.state_space.vertices[state1].location
-        (x2, y2) = self.state_space.vertices[state2].location
-        return c + math.hypot(x2 - x1, y2 - y1)
+        return c + self._edge_cost[(state1, state2)]
 
     def h(self, node):
         """
-        Straight-line distance to the goal, for A*.
+        Straight-line distance to the problem's goal, for A*.
+        Values depend only on the state, so they are cached per state.
+        """
+        if hasattr(node, 'state'):
+            s = node.state
+        else:
+            s = node
+        r = self._h_cache.get(s)
+        if r is None:
+            (x1, y1) = self._loc[s]
+            (xg, yg) = self._goal_xy
+            r = math.hypot(xg - x1, yg - y1)
+            self._h_cache[s] = r
+        return r
+
+    def h_initial(self, node):
+        """
+        Straight-line distance to the initial state, for the backward
+        half of bidirectional A*.
         """
         if hasattr(node, 'state'):
             s = node.state
         else:
             s = node
-        (x1, y1) = self.state_space.vertices[s].location
-        (xg, yg) = self.state_space.goal.location
-        return math.hypot(xg - x1, yg - y1)
+        (x1, y1) = self._loc[s]
+        (xs, ys) = self._loc[self.initial]
+        return math.hypot(xs - x1, ys - y1)
 
 
-def run_searches(problem):
+def _path_to_node(problem, states):
     """
-    Execute BFS, DFS, UCS, and A* on the given problem.
-    Return a dictionary of results: { 'BFS': (solution, cost), ... }
+    Turn a list of states from initial to goal into a chain of Nodes and
+    return the last one, so callers can use node.path() and node.path_cost
+    as with the Berkeley searches.
     """
-    results = {}
+    node = Node(states[0])
+    for nxt in states[1:]:
+        action = next(a for a in problem.actions(node.state)
+                      if problem.result(node.state, a) == nxt)
+        node = node.child_node(problem, action)
+    return node
 
-    # BFS
-    bfs_node = breadth_first_graph_search(problem)
-    if bfs_node:
-        path_bfs = [n.state for n in bfs_node.path()]
-        results['BFS'] = (path_bfs, bfs_node.path_cost)
-    else:
-        results['BFS'] = (None, None)
 
-    # DFS
-    dfs_node = depth_first_graph_search(problem)
-    if dfs_node:
-        path_dfs = [n.state for n in dfs_node.path()]
-        results['DFS'] = (path_dfs, dfs_node.path_cost)
-    else:
-        results['DFS'] = (None, None)
+def _join_paths(forward_parents, backward_parents, meet):
+    """
+    Join the parent chains of both searches at 'meet' into one list of
+    states from the initial state to the goal.
+    """
+    states = []
+    s = meet
+    while s is not None:
+        states.append(s)
+        s = forward_parents[s]
+    states.reverse()
+    s = backward_parents[meet]
+    while s is not None:
+        states.append(s)
+        s = backward_parents[s]
+    return states
+
+
+def bidirectional_bfs(problem):
+    """
+    Breadth-first search from the initial state and the goal at the same time.
+    Each step expands one whole layer of the smaller frontier, and the search
+    stops as soon as a generated state has been reached from the other side.
+    Assumes every move can be reversed (undirected graph), as in the
+    Figure 3.31 environment. Returns the goal Node, or None.
+    """
+    start, goal = problem.initial, problem.goal
+    if problem.goal_test(start):
+        return Node(start)
+
+    forward_parents, backward_parents = {start: None}, {goal: None}
+    forward_frontier, backward_frontier = deque([start]), deque([goal])
+
+    while forward_frontier and backward_frontier:
+        if len(forward_frontier) <= len(backward_frontier):
+            frontier, parents, other = forward_frontier, forward_parents, backward_parents
+        else:
+            frontier, parents, other = backward_frontier, backward_parents, forward_parents
+
+        for _ in range(len(frontier)):
+            state = frontier.popleft()
+            for action in problem.actions(state):
+                child = problem.result(state, action)
+                if child in parents:
+                    continue
+                parents[child] = state
+                if child in other:
+                    states = _join_paths(forward_parents, backward_parents, child)
+                    return _path_to_node(problem, states)
+                frontier.append(child)
+    return None
 
-    # UCS
-    ucs_node = uniform_cost_search(problem)
-    if ucs_node:
-        path_ucs = [n.state for n in ucs_node.path()]
-        results['UCS'] = (path_ucs, ucs_node.path_cost)
-    else:
-        results['UCS'] = (None, None)
 
-    # A*
-    astar_node = astar_search(problem, problem.h)
-    if astar_node:
-        path_astar = [n.state for n in astar_node.path()]
-        results['A*'] = (path_astar, astar_node.path_cost)
+def bidirectional_astar_search(problem, h_forward=None, h_backward=None):
+    """
+    Bidirectional A* (Pohl): one A* search from the initial state guided by
+    h_forward (default problem.h) and one from the goal guided by h_backward
+    (default problem.h_initial). Expands from the smaller open list each step
+    and stops once either open list's best f reaches the cheapest meeting cost
+    found so far. Assumes reversible moves with symmetric costs and consistent
+    heuristics. Returns the goal Node, or None.
+    """
+    start, goal = problem.initial, problem.goal
+    if problem.goal_test(start):
+        return Node(start)
+
+    h = (h_forward or problem.h, h_backward or problem.h_initial)
+    tiebreak = count()
+    g = ({start: 0}, {goal: 0})
+    parents = ({start: None}, {goal: None})
+    closed = (set(), set())
+    open_lists = ([(h[0](start), next(tiebreak), start)],
+                  [(h[1](goal), next(tiebreak), goal)])
+    best_cost, meet = math.inf, None
+
+    while open_lists[0] and open_lists[1]:
+        if open_lists[0][0][0] >= best_cost or open_lists[1][0][0] >= best_cost:
+            break
+        side = 0 if len(open_lists[0]) <= len(open_lists[1]) else 1
+        _, _, state = heapq.heappop(open_lists[side])
+        if state in closed[side]:
+            continue
+        closed[side].add(state)
+
+        g_side, g_other = g[side], g[1 - side]
+        for action in problem.actions(state):
+            child = problem.result(state, action)
+            cost = problem.path_cost(g_side[state], state, action, child)
+            if cost < g_side.get(child, math.inf):
+                g_side[child] = cost
+                parents[side][child] = state
+                heapq.heappush(open_lists[side], (cost + h[side](child), next(tiebreak), child))
+                if child in g_other and cost + g_other[child] < best_cost:
+                    best_cost, meet = cost + g_other[child], child
+
+    if meet is None:
+        return None
+    return _path_to_node(problem, _join_paths(parents[0], parents[1], meet))
+
+
+# Bucket array limits for bucket_astar_search.
+BUCKETS_PER_STATE = 4
+DEFAULT_MAX_BUCKETS = 4096
+
+
+def bucket_astar_search(problem, h=None, scale=10):
+    """
+    A* graph search whose open list is a bucket queue: a node with
+    f = g + h goes into bucket int(f * scale), and pops scan forward from
+    the current bucket. Each bucket is a small heap, so pops stay exact and
+    the result matches astar_search. The bucket array covers f up to twice
+    h(initial), but holds at most BUCKETS_PER_STATE buckets per state
+    (problem.num_states(), if the problem has it) so its size follows the
+    graph rather than the coordinate scale; nodes beyond it go to an
+    overflow heap. Returns the goal Node, or None.
+    """
+    h = h or problem.h
+    tiebreak = count()
+    root = Node(problem.initial)
+    f_max = 2 * h(root)
+    if hasattr(problem, 'num_states'):
+        max_buckets = BUCKETS_PER_STATE * problem.num_states()
     else:
-        results['A*'] = (None, None)
+        max_buckets = DEFAULT_MAX_BUCKETS
+    buckets = [[] for _ in range(max(1, min(int(f_max * scale) + 1, max_buckets)))]
+    overflow = []
+    cur = 0
+    size = 0
+
+    def push(node):
+        nonlocal cur, size
+        f = node.path_cost + h(node)
+        entry = (f, next(tiebreak), node)
+        idx = int(f * scale)
+        if idx < len(buckets):
+            heapq.heappush(buckets[idx], entry)
+            cur = min(cur, idx)
+        else:
+            heapq.heappush(overflow, entry)
+        size += 1
+
+    def pop():
+        nonlocal cur, size
+        while cur < len(buckets) and not buckets[cur]:
+            cur += 1
+        size -= 1
+        if cur < len(buckets):
+            return heapq.heappop(buckets[cur])[2]
+        return heapq.heappop(overflow)[2]
+
+    push(root)
+    best_g = {root.state: 0}
+    explored = set()
+    while size:
+        node = pop()
+        if node.state in explored:
+            continue
+        if problem.goal_test(node.state):
+            return node
+        explored.add(node.state)
+        for child in node.expand(problem):
+            if child.state not in explored and child.path_cost < best_g.get(child.state, math.inf):
+                best_g[child.state] = child.path_cost
+                push(child)
+    return None
+
+
+def _solution(problem, node):
+    """
+    Convert a goal Node into (list of vertex names, path cost),
+    or (None, None) if no solution was found.
+    """
+    if node:
+        return [problem.state_name(n.state) for n in node.path()], node.path_cost
+    return None, None
+
+
+def run_searches(problem, max_workers=None):
+    """
+    Execute BFS, DFS, UCS, A*, bidirectional BFS/A*, and bucket-queue A*
+    on the given problem.
+    The searches run one after another by default. Given 'max_workers',
+    they run on a thread pool of that many threads instead; the only state
+    they share is problem.h's memo (_h_cache), whose entries each thread
+    computes identically. Pure-Python searches hold the GIL, so the pool
+    only pays off when the searches are slow enough to outweigh its
+    overhead.
+    Return a dictionary of results: { 'BFS': (solution, cost), ... },
+    where each solution is a list of vertex names.
+    """
+    searches = {
+        'BFS': lambda: breadth_first_graph_search(problem),
+        'DFS': lambda: depth_first_graph_search(problem),
+        'UCS': lambda: uniform_cost_search(problem),
+        'A*': lambda: astar_search(problem, problem.h),
+        'BiBFS': lambda: bidirectional_bfs(problem),
+        'BiA*': lambda: bidirectional_astar_search(problem),
+        'BucketA*': lambda: bucket_astar_search(problem, problem.h),
+    }
 
-    return results
+    if max_workers is None:
+        return {algo: _solution(problem, search()) for algo, search in searches.items()}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {algo: executor.submit(search) for algo, search in searches.items()}
+        return {algo: _solution(problem, future.result()) for algo, future in futures.items()}
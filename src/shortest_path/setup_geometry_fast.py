@@ -0,0 +1,36 @@
+"""
+setup_geometry_fast.py
+
+Builds the optional Cython extension shortest_path._geometry_fast
+in place, next to geometry.py:
+
+    python shortest_path/setup_geometry_fast.py build_ext --inplace
+
+Requires Cython, NumPy and a C compiler. Without it, geometry.py uses
+Numba or plain Python instead.
+"""
+
+import os
+import sys
+
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+# Build relative to src/ so the extension lands in the shortest_path package.
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Keep multiply-adds unfused so results match the Numba and Python paths bit for bit.
+if sys.platform == "win32":
+    compile_args = ["/O2", "/fp:precise"]
+else:
+    compile_args = ["-O3", "-march=native", "-ffp-contract=off"]
+
+setup(
+    name="shortest_path_geometry_fast",
+    ext_modules=cythonize(
+        [Extension("shortest_path._geometry_fast",
+                   [os.path.join("shortest_path", "_geometry_fast.pyx")],
+                   extra_compile_args=compile_args)],
+        language_level=3,
+    ),
+)
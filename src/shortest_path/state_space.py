@@ -9,12 +9,12 @@ draw() method that displays the environment with polygon labels (one per shape).
 PEP 8–compliant and documented.
 """
 
-import itertools
-import math
 import os
-import matplotlib.pyplot as plt
+import numpy as np
 
-from .geometry import segments_intersect, line_clear, point_in_polygon
+from .geometry import (segments_intersect, point_in_polygon, polygon_edge_arrays,
+                       polygon_bboxes, occupancy_grid,
+                       segments_near_obstacles, line_clear_batch)
 
 
 class Vertex:
@@ -26,13 +26,18 @@ class Vertex:
         name (str): Unique identifier for the vertex.
         reachable (dict): Maps move vectors (dx, dy) to neighbor vertex names.
         edges (list): List of neighbor vertex names connected by polygon edges.
+        neighbors (set): Names of all reachable vertices, for O(1) membership tests.
     """
 
+    # No per-instance __dict__: smaller vertices and faster attribute access.
+    __slots__ = ('location', 'name', 'reachable', 'edges', 'neighbors')
+
     def __init__(self, x, y, name):
         self.location = (x, y)
         self.name = name
         self.reachable = {}  # {(dx, dy): neighbor_name}
         self.edges = []      # list of neighbor names (manually connected)
+        self.neighbors = set()  # {neighbor_name}
 
 
 class StateSpace:
@@ -41,38 +46,95 @@ class StateSpace:
 
     Attributes:
         vertices (dict): Mapping of vertex names to Vertex objects.
-        polygon_edges (list): List of edges (tuples) representing polygon boundaries.
-        auto_edges (list): List of automatically generated edges (optional).
+        polygon_edges (list): Polygon boundary edges, as ((x1, y1), (x2, y2)) tuples.
+        auto_edges (list): Automatically generated edges (optional), in the same form.
         polygons (list): List of polygon definitions; each is a dictionary with keys:
-            'label' - a shape label, and 'vertices' - a list of vertex names.
+            'label' - a shape label, 'vertices' - a list of vertex names, and
+            'centroid' - the (x, y) mean of its vertices, used to place the label.
         start (Vertex): The start vertex.
         goal (Vertex): The goal vertex.
+
+    Each vertex also gets a dense integer ID, in insertion order, for search
+    code that prefers int states (see id_of and name_of); finalize() exposes
+    the locations and adjacency as arrays indexed by those IDs.
     """
 
     def __init__(self):
         self.vertices = {}
+        self._id_of = {}         # {vertex_name: int id}
+        self._name_of = []       # [vertex_name] indexed by id
+        self._locations = []     # [(x, y)] indexed by id
+        # Int-indexed snapshot of the graph, filled in by finalize().
+        self.loc_array = None    # float64 array of shape (N, 2)
+        self.adj = None          # [int32 array of neighbor ids] indexed by id
         self.polygon_edges = []  # For drawing polygon edges (thick lines)
         self.auto_edges = []     # For drawing auto-discovered edges (optional)
-        self.polygons = []       # List of polygons; each: {'label': str or None, 'vertices': [names]}
+        self.polygons = []       # List of polygons; each: {'label', 'vertices', 'centroid'}
         self.start = None
         self.goal = None
+        # Packed polygon geometry for the batched geometry kernels, rebuilt
+        # lazily by _ensure_poly_arrays() after polygons or vertices change.
+        self._poly_coords = []
+        self._poly_edges = None
+        self._poly_grid = None
+        self._poly_dirty = True
+        # polygon_edges as one float64 (E, 2, 2) array, rebuilt lazily by
+        # edge_array() after edges are added.
+        self._edge_array = None
+        self._edge_dirty = True
+
+    def _register(self, v):
+        """Store vertex v and give its name an integer ID if it is new."""
+        self._poly_dirty = True
+        self.vertices[v.name] = v
+        if v.name not in self._id_of:
+            self._id_of[v.name] = len(self._name_of)
+            self._name_of.append(v.name)
+            self._locations.append(v.location)
+        else:
+            self._locations[self._id_of[v.name]] = v.location
 
     def add_vertex(self, x, y, name):
         """Add a vertex with coordinates (x, y) and unique name."""
-        self.vertices[name] = Vertex(x, y, name)
+        self._register(Vertex(x, y, name))
 
     def set_start(self, x, y, name="S"):
         """Define the start vertex."""
         v = Vertex(x, y, name)
-        self.vertices[name] = v
+        self._register(v)
         self.start = v
 
     def set_goal(self, x, y, name="G"):
         """Define the goal vertex."""
         v = Vertex(x, y, name)
-        self.vertices[name] = v
+        self._register(v)
         self.goal = v
 
+    def id_of(self, name):
+        """Return the integer ID of the vertex called 'name'."""
+        return self._id_of[name]
+
+    def name_of(self, vertex_id):
+        """Return the name of the vertex with integer ID 'vertex_id'."""
+        return self._name_of[vertex_id]
+
+    def num_vertices(self):
+        """Return the number of vertices (IDs run from 0 to this minus one)."""
+        return len(self._name_of)
+
+    def finalize(self):
+        """
+        Snapshot the finished graph in int-indexed form: loc_array holds every
+        vertex location as a float64 array of shape (N, 2), and adj[i] the IDs
+        of vertex i's reachable neighbors as an int32 array, in the order they
+        were asserted. Call again after adding vertices or connections.
+        """
+        self.loc_array = np.asarray(self._locations, dtype=np.float64).reshape(-1, 2)
+        id_of = self._id_of
+        self.adj = [np.fromiter((id_of[nb] for nb in self.vertices[name].reachable.values()),
+                                dtype=np.int32)
+                    for name in self._name_of]
+
     def add_edge(self, a, b):
         """
         Connect two vertices a and b as part of a polygon.
@@ -83,7 +145,8 @@ class StateSpace:
 
         x1, y1 = self.vertices[a].location
         x2, y2 = self.vertices[b].location
-        self.polygon_edges.append(((x1, x2), (y1, y2)))
+        self.polygon_edges.append(((x1, y1), (x2, y2)))
+        self._edge_dirty = True
         self.assert_reachable(a, b)
 
     def connect_polygon(self, v_names, shape_label=None):
@@ -91,60 +154,142 @@ class StateSpace:
         Connect a list of vertices in order to form a closed polygon.
         Optionally assign a shape_label to the polygon (only one label per shape).
         """
-        for i in range(len(v_names) - 1):
-            self.add_edge(v_names[i], v_names[i + 1])
-        self.add_edge(v_names[0], v_names[-1])
+        # Same edges, in the same order, as calling add_edge on each consecutive
+        # pair and then on (first, last), with one assert_reachable_bulk call
+        # and one extend of polygon_edges for the whole polygon.
+        pairs = list(zip(v_names, v_names[1:])) + [(v_names[0], v_names[-1])]
+        vertices = self.vertices
+        for a, b in pairs:
+            vertices[a].edges.append(b)
+            vertices[b].edges.append(a)
+        self.assert_reachable_bulk(pairs)
+        self.polygon_edges.extend((vertices[a].location, vertices[b].location) for a, b in pairs)
+        self._edge_dirty = True
 
+        # The label is drawn at the centroid; vertices never move, so compute it once.
+        cx = sum(self.vertices[v].location[0] for v in v_names) / len(v_names)
+        cy = sum(self.vertices[v].location[1] for v in v_names) / len(v_names)
         self.polygons.append({
             'label': shape_label,
-            'vertices': v_names
+            'vertices': v_names,
+            'centroid': (cx, cy)
         })
+        self._poly_dirty = True
+
+    def edge_array(self):
+        """
+        Return polygon_edges as a float64 array of shape (E, 2, 2), where
+        [i, 0] and [i, 1] are the endpoints of edge i. The array is cached
+        and only rebuilt after edges are added; do not modify it.
+        """
+        if self._edge_dirty:
+            self._edge_array = np.asarray(self.polygon_edges, dtype=np.float64).reshape(-1, 2, 2)
+            self._edge_dirty = False
+        return self._edge_array
+
+    def _ensure_poly_arrays(self):
+        """
+        Rebuild the cached polygon coordinates, their packed form
+        (PolygonEdges) and the occupancy grid of their bounding boxes if
+        anything changed since the last call. Vertex names are resolved to
+        locations only here.
+        """
+        if not self._poly_dirty:
+            return
+        self._poly_coords = [[self.vertices[name].location for name in poly['vertices']]
+                             for poly in self.polygons]
+        self._poly_edges = polygon_edge_arrays(self._poly_coords)
+        self._poly_grid = occupancy_grid(polygon_bboxes(self._poly_coords))
+        self._poly_dirty = False
 
     def assert_reachable(self, a, b):
         """
         Manually assert that vertices a and b are reachable from each other.
-        Updates the 'reachable' dictionaries in both vertices.
+        Updates the 'reachable' dictionaries and 'neighbors' sets in both vertices.
         """
         if isinstance(b, str):
             b = [b]
-        for v in b:
-            x1, y1 = self.vertices[a].location
-            x2, y2 = self.vertices[v].location
+        self.assert_reachable_bulk((a, v) for v in b)
+
+    def assert_reachable_bulk(self, pairs):
+        """
+        Assert mutual reachability for every (a, b) pair in 'pairs' in one pass.
+        Pairs are applied in order, with the same effect as calling
+        assert_reachable(a, b) for each of them.
+        """
+        vertices = self.vertices
+        for a, b in pairs:
+            va, vb = vertices[a], vertices[b]
+            x1, y1 = va.location
+            x2, y2 = vb.location
             dx = x2 - x1
             dy = y2 - y1
-            self.vertices[a].reachable[(dx, dy)] = v
-            self.vertices[v].reachable[(-dx, -dy)] = a
+            va.reachable[(dx, dy)] = b
+            vb.reachable[(-dx, -dy)] = a
+            va.neighbors.add(b)
+            vb.neighbors.add(a)
 
-    def build_automated_connections(self, polygons, samples=5, max_len=6.0):
+    def build_automated_connections(self, polygons=None, samples=5, max_len=6.0):
         """
         Automatically build edges for any vertex pairs that are not manually connected,
         using geometry checks (line_clear).
         
         Args:
             polygons (list): List of polygons, each given as a list of vertex names.
+                Defaults to this state space's own polygons, whose packed
+                geometry is cached between calls.
             samples (int): Number of sample points for line clearance.
             max_len (float): Maximum allowed length for auto-added edges.
         """
-        names = list(self.vertices.keys())
-        # Convert each polygon into a list of coordinate tuples.
-        poly_coords = []
-        for poly in polygons:
-            coords = [self.vertices[name].location for name in poly]
-            poly_coords.append(coords)
-
-        for a, b in itertools.combinations(names, 2):
-            if any(b == nb for nb in self.vertices[a].reachable.values()):
-                continue  # Skip if already manually connected.
-            va = self.vertices[a].location
-            vb = self.vertices[b].location
-            dist = math.hypot(vb[0] - va[0], vb[1] - va[1])
-            if dist > max_len:
-                continue  # Skip overly long edges.
-            if line_clear(va, vb, poly_coords, samples):
-                self.auto_edges.append(((va[0], vb[0]), (va[1], vb[1])))
+        names = self._name_of
+        if polygons is None:
+            self._ensure_poly_arrays()
+            poly_coords = self._poly_coords
+            poly_edges = self._poly_edges
+            poly_grid = self._poly_grid
+        else:
+            # Convert each polygon into a list of coordinate tuples.
+            poly_coords = []
+            for poly in polygons:
+                coords = [self.vertices[name].location for name in poly]
+                poly_coords.append(coords)
+            # Pack the polygons once for the batched clearance tests.
+            poly_edges = polygon_edge_arrays(poly_coords)
+            poly_grid = occupancy_grid(polygon_bboxes(poly_coords))
+
+        # Pairwise squared distances in one NumPy pass; keep pairs within max_len
+        # by comparing against its square, so no square roots are taken.
+        max_len_sq = max_len * max_len
+        points = np.asarray(self._locations, dtype=np.float64).reshape(-1, 2)
+        diff = points[:, None, :] - points[None, :, :]
+        d2 = np.einsum('ijk,ijk->ij', diff, diff)
+        rows, cols = np.triu_indices(len(names), k=1)
+        keep = d2[rows, cols] <= max_len_sq
+
+        # Skip pairs that are already manually connected, looking each vertex's
+        # neighbor set up by vertex ID.
+        neigh = [self.vertices[n].neighbors for n in names]
+        candidates = [(i, j) for i, j in zip(rows[keep].tolist(), cols[keep].tolist())
+                      if names[j] not in neigh[i]]
+        if not candidates:
+            return
+        idx_a, idx_b = np.array(candidates).T
+        segs = np.column_stack([points[idx_a], points[idx_b]])
+        # Segments over empty cells of the occupancy grid are clear without testing.
+        near = segments_near_obstacles(segs, poly_grid)
+        clear = np.ones(len(segs), dtype=bool)
+        if near.any():
+            clear[near] = line_clear_batch(segs[near], poly_coords, samples, edges=poly_edges)
+
+        for (i, j), is_clear in zip(candidates, clear.tolist()):
+            if is_clear:
+                a, b = names[i], names[j]
+                va = self.vertices[a].location
+                vb = self.vertices[b].location
+                self.auto_edges.append((va, vb))
                 self.assert_reachable(a, b)
 
-    def draw(self):
+    def draw(self, grid=True):
         """
         Draws the state space, including:
           - Polygon edges (thick black lines)
@@ -152,20 +297,21 @@ class StateSpace:
           - Vertices (blue dots)
           - Start and Goal (green and red)
           - Polygon labels: one label per polygon at its centroid.
+
+        Args:
+            grid (bool): Draw the background grid; turn off for very large
+                environments.
         """
-        fig, ax = plt.subplots()
+        # Imported here so building and searching never load matplotlib.
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection
 
-        # Draw polygon edges.
-        for edge in self.polygon_edges:
-            x_vals, y_vals = edge
-            ax.plot([x_vals[0], x_vals[1]], [y_vals[0], y_vals[1]],
-                    color="black", linewidth=2)
+        fig, ax = plt.subplots()
 
-        # Draw auto edges.
-        for edge in self.auto_edges:
-            x_vals, y_vals = edge
-            ax.plot([x_vals[0], x_vals[1]], [y_vals[0], y_vals[1]],
-                    color="gray", linestyle="--", linewidth=1)
+        # Draw polygon edges and auto edges, one LineCollection per style.
+        ax.add_collection(LineCollection(self.edge_array(), colors="black", linewidths=2))
+        ax.add_collection(LineCollection(self.auto_edges, colors="gray",
+                                         linestyles="--", linewidths=1))
 
         # Draw polygon labels (one label per polygon).
         for poly_info in self.polygons:
@@ -173,30 +319,30 @@ class StateSpace:
             label = poly_info['label']
             if not verts or not label:
                 continue
-            xs = [self.vertices[v].location[0] for v in verts]
-            ys = [self.vertices[v].location[1] for v in verts]
-            cx = sum(xs) / len(xs)
-            cy = sum(ys) / len(ys)
+            cx, cy = poly_info['centroid']
             ax.text(cx, cy, label, fontsize=10, color="black", fontweight="bold",
                     horizontalalignment='center', verticalalignment='center')
 
-        # Draw vertices (blue dots).
-        for v in self.vertices.values():
-            ax.plot(v.location[0], v.location[1], "bo", markersize=4)
+        # Draw vertices (blue dots) with a single scatter call.
+        locs = np.array([v.location for v in self.vertices.values()], dtype=float).reshape(-1, 2)
+        ax.scatter(locs[:, 0], locs[:, 1], c="b", s=16)
+        ax.autoscale_view()
 
-        # Mark start and goal.
+        # Mark start and goal, one labelled scatter point each.
         if self.start:
-            ax.plot(self.start.location[0], self.start.location[1],
-                    "go", markersize=8, label="Start")
+            ax.scatter([self.start.location[0]], [self.start.location[1]],
+                       c="g", s=64, label="Start")
         if self.goal:
-            ax.plot(self.goal.location[0], self.goal.location[1],
-                    "ro", markersize=8, label="Goal")
+            ax.scatter([self.goal.location[0]], [self.goal.location[1]],
+                       c="r", s=64, label="Goal")
 
         ax.set_title("Figure 3.31 State Space")
         ax.set_xlabel("X")
         ax.set_ylabel("Y")
-        ax.grid(True)
-        ax.legend()
+        if grid:
+            ax.grid(True)
+        if self.start or self.goal:
+            ax.legend()
         plt.show()
 
 